@@ -1,16 +1,17 @@
 """Class-based api"""
 import inspect
 import os
-import re
 import sys
 import typing
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Dict,
     Iterable,
     List,
     Optional,
+    Pattern,
     Set,
     Tuple,
     Type,
@@ -52,6 +53,7 @@ else:
     from typing import get_type_hints
 
 SchemaIndex = Union[schema_components.Index, schema_components.MultiIndex]
+_CheckInfos = Tuple[Dict[str, FieldCheckInfo], Dict[str, CheckInfo]]
 
 
 _CONFIG_KEY = "Config"
@@ -158,6 +160,8 @@ class SchemaModel:
     def __init_subclass__(cls, **kwargs):
         """Ensure :class:`~pandera.model_components.FieldInfo` instances."""
         super().__init_subclass__(**kwargs)
+        # the schema is built lazily by to_schema, don't expose the parent's
+        cls.__schema__ = None
         # pylint:disable=no-member
         subclass_annotations = cls.__dict__.get("__annotations__", {})
         for field_name in subclass_annotations.keys():
@@ -170,8 +174,9 @@ class SchemaModel:
     @classmethod
     def to_schema(cls) -> DataFrameSchema:
         """Create :class:`~pandera.DataFrameSchema` from the :class:`.SchemaModel`."""
-        if cls in MODEL_CACHE:
-            return MODEL_CACHE[cls]
+        schema = MODEL_CACHE.get(cls)
+        if schema is not None:
+            return schema
 
         cls.__config__, extras = cls._collect_config_and_extras()
         mi_kwargs = {
@@ -181,15 +186,12 @@ class SchemaModel:
         }
 
         cls.__fields__ = cls._collect_fields()
-        check_infos = typing.cast(
-            List[FieldCheckInfo], cls._collect_check_infos(CHECK_KEY)
-        )
+        check_infos, df_check_infos = cls._collect_check_infos()
 
         cls.__checks__ = cls._extract_checks(
-            check_infos, field_names=list(cls.__fields__.keys())
+            check_infos, field_names=cls.__fields__.keys()
         )
 
-        df_check_infos = cls._collect_check_infos(DATAFRAME_CHECK_KEY)
         df_custom_checks = cls._extract_df_checks(df_check_infos)
         df_registered_checks = _convert_extras_to_checks(extras)
         cls.__dataframe_checks__ = df_custom_checks + df_registered_checks
@@ -206,8 +208,7 @@ class SchemaModel:
             name=cls.__config__.name,
             ordered=cls.__config__.ordered,
         )
-        if cls not in MODEL_CACHE:
-            MODEL_CACHE[cls] = cls.__schema__
+        MODEL_CACHE[cls] = cls.__schema__
         return cls.__schema__
 
     @classmethod
@@ -265,9 +266,9 @@ class SchemaModel:
         columns: Dict[str, schema_components.Column] = {}
         indices: List[schema_components.Index] = []
         for field_name, (annotation, field) in fields.items():
-            field_checks = checks.get(field_name, [])
+            field_checks = checks.get(field_name)
             field_name = field.name
-            check_name = getattr(field, "check_name", None)
+            check_name = field.check_name
 
             if annotation.metadata:
                 if field.dtype_kwargs:
@@ -282,16 +283,12 @@ class SchemaModel:
                 dtype = annotation.arg
 
             if annotation.origin is Series:
-                col_constructor = (
-                    field.to_column if field else schema_components.Column
-                )
-
                 if check_name is False:
                     raise SchemaInitError(
                         f"'check_name' is not supported for {field_name}."
                     )
 
-                columns[field_name] = col_constructor(  # type: ignore
+                columns[field_name] = field.to_column(
                     dtype,
                     required=not annotation.optional,
                     checks=field_checks,
@@ -310,10 +307,7 @@ class SchemaModel:
                 ):
                     field_name = None  # type:ignore
 
-                index_constructor = (
-                    field.to_index if field else schema_components.Index
-                )
-                index = index_constructor(  # type: ignore
+                index = field.to_index(
                     dtype, checks=field_checks, name=field_name
                 )
                 indices.append(index)
@@ -329,8 +323,8 @@ class SchemaModel:
         """Return all attributes.
         Similar to inspect.get_members but bypass descriptors __get__.
         """
-        bases = inspect.getmro(cls)[:-1]  # bases -> SchemaModel -> object
-        attrs = {}
+        bases = cls.__mro__[:-1]  # bases -> SchemaModel -> object
+        attrs: Dict[str, Any] = {}
         for base in reversed(bases):
             attrs.update(base.__dict__)
         return attrs
@@ -338,19 +332,24 @@ class SchemaModel:
     @classmethod
     def _collect_fields(cls) -> Dict[str, Tuple[AnnotationInfo, FieldInfo]]:
         """Centralize publicly named fields and their corresponding annotations."""
-        annotations = get_type_hints(  # pylint:disable=unexpected-keyword-arg
+        type_hints = get_type_hints(  # pylint:disable=unexpected-keyword-arg
             cls, include_extras=True
         )
+        annotations = {
+            name: annotation
+            for name, annotation in type_hints.items()
+            if _is_field(name)
+        }
         attrs = cls._get_model_attrs()
 
-        missing = []
-        for name, attr in attrs.items():
-            if inspect.isroutine(attr):
-                continue
-            if not _is_field(name):
-                annotations.pop(name, None)
-            elif name not in annotations:
-                missing.append(name)
+        # only unannotated public attributes need the routine check
+        missing = [
+            name
+            for name, attr in attrs.items()
+            if _is_field(name)
+            and name not in annotations
+            and not inspect.isroutine(attr)
+        ]
 
         if missing:
             raise SchemaInitError(f"Found missing annotations: {missing}")
@@ -388,50 +387,57 @@ class SchemaModel:
         return type("Config", (BaseConfig,), options), extras
 
     @classmethod
-    def _collect_check_infos(cls, key: str) -> List[CheckInfo]:
-        """Collect inherited check metadata from bases.
+    def _collect_check_infos(
+        cls,
+    ) -> Tuple[List[FieldCheckInfo], List[CheckInfo]]:
+        """Collect inherited field and dataframe check metadata from bases.
         Inherited classmethods are not in cls.__dict__, that's why we need to
-        walk the inheritance tree.
+        walk the inheritance tree. The bases are scanned when the schema is
+        built so that checks attached after class creation are included.
         """
-        bases = inspect.getmro(cls)[:-2]  # bases -> SchemaModel -> object
+        bases = cls.__mro__[:-2]  # bases -> SchemaModel -> object
         bases = typing.cast(Tuple[Type[SchemaModel]], bases)
 
-        method_names = set()
-        check_infos = []
+        check_names: Set[str] = set()
+        df_check_names: Set[str] = set()
+        check_infos: List[FieldCheckInfo] = []
+        df_check_infos: List[CheckInfo] = []
         for base in bases:
-            for attr_name, attr_value in vars(base).items():
-                check_info = getattr(attr_value, key, None)
-                if not isinstance(check_info, CheckInfo):
-                    continue
-                if attr_name in method_names:  # check overridden by subclass
-                    continue
-                method_names.add(attr_name)
-                check_infos.append(check_info)
-        return check_infos
+            own_checks, own_df_checks = _collect_own_check_infos(base)
+
+            # skip checks overridden by subclass
+            for attr_name, check_info in own_checks.items():
+                if attr_name not in check_names:
+                    check_names.add(attr_name)
+                    check_infos.append(check_info)
+            for attr_name, df_check_info in own_df_checks.items():
+                if attr_name not in df_check_names:
+                    df_check_names.add(attr_name)
+                    df_check_infos.append(df_check_info)
+        return check_infos, df_check_infos
 
     @classmethod
     def _extract_checks(
-        cls, check_infos: List[FieldCheckInfo], field_names: List[str]
+        cls, check_infos: List[FieldCheckInfo], field_names: AbstractSet[str]
     ) -> Dict[str, List[Check]]:
         """Collect field annotations from bases in mro reverse order."""
         checks: Dict[str, List[Check]] = {}
         for check_info in check_infos:
-            check_info_fields = {
-                field.name if isinstance(field, FieldInfo) else field
-                for field in check_info.fields
-            }
-            if check_info.regex:
-                matched = _regex_filter(field_names, check_info_fields)
-            else:
-                matched = check_info_fields
-
             check_ = check_info.to_check(cls)
 
-            for field in matched:
-                if field not in field_names:
+            matched: AbstractSet[str]
+            if check_info.regex:
+                matched = _regex_filter(field_names, check_info.patterns)
+            else:
+                matched = check_info.field_names
+                missing = matched - field_names
+                if missing:
                     raise SchemaInitError(
-                        f"Check {check_.name} is assigned to a non-existing field '{field}'."
+                        f"Check {check_.name} is assigned to a non-existing "
+                        f"field '{min(missing)}'."
                     )
+
+            for field in matched:
                 if field not in checks:
                     checks[field] = []
                 checks[field].append(check_)
@@ -443,6 +449,23 @@ class SchemaModel:
         return [check_info.to_check(cls) for check_info in check_infos]
 
 
+def _collect_own_check_infos(model: Type) -> _CheckInfos:
+    """Collect check metadata of the methods defined directly on a class."""
+    check_infos: Dict[str, FieldCheckInfo] = {}
+    df_check_infos: Dict[str, CheckInfo] = {}
+    for attr_name, attr_value in vars(model).items():
+        # check decorators always return a classmethod
+        if not isinstance(attr_value, classmethod):
+            continue
+        check_info = getattr(attr_value, CHECK_KEY, None)
+        if isinstance(check_info, FieldCheckInfo):
+            check_infos[attr_name] = check_info
+        df_check_info = getattr(attr_value, DATAFRAME_CHECK_KEY, None)
+        if isinstance(df_check_info, CheckInfo):
+            df_check_infos[attr_name] = df_check_info
+    return check_infos, df_check_infos
+
+
 def _build_schema_index(
     indices: List[schema_components.Index], **multiindex_kwargs: Any
 ) -> Optional[SchemaIndex]:
@@ -455,11 +478,10 @@ def _build_schema_index(
     return index
 
 
-def _regex_filter(seq: Iterable, regexps: Iterable[str]) -> Set[str]:
-    """Filter items matching at least one of the regexes."""
+def _regex_filter(seq: Iterable, patterns: Iterable[Pattern]) -> Set[str]:
+    """Filter items matching at least one of the compiled regexes."""
     matched: Set[str] = set()
-    for regex in regexps:
-        pattern = re.compile(regex)
+    for pattern in patterns:
         matched.update(filter(pattern.match, seq))
     return matched
 
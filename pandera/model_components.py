@@ -1,12 +1,16 @@
 """SchemaModel components"""
+import re
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
-    Set,
+    Pattern,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -31,11 +35,17 @@ DATAFRAME_CHECK_KEY = "__dataframe_check_config__"
 
 _CheckList = Union[Check, List[Check]]
 
+_NO_CHECKS: Tuple[Check, ...] = ()
 
-def _to_checklist(checks: Optional[_CheckList]) -> List[Check]:
-    checks = checks or []
-    if isinstance(checks, Check):  # pragma: no cover
-        return [checks]
+# inline global flags, e.g. "(?i)", only apply at the start of an expression
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def _to_checklist(checks: Optional[_CheckList]) -> Sequence[Check]:
+    if checks is None:
+        return _NO_CHECKS
+    if isinstance(checks, Check):
+        return (checks,)
     return checks
 
 
@@ -68,7 +78,7 @@ class FieldInfo:
         check_name: bool = None,
         dtype_kwargs: Dict[str, Any] = None,
     ) -> None:
-        self.checks = _to_checklist(checks)
+        self.checks: Tuple[Check, ...] = tuple(_to_checklist(checks))
         self.nullable = nullable
         self.allow_duplicates = allow_duplicates
         self.coerce = coerce
@@ -98,18 +108,22 @@ class FieldInfo:
         self,
         pandas_dtype: PandasDtypeInputTypes,
         component: Type[SchemaComponent],
-        checks: _CheckList = None,
+        checks: Optional[_CheckList] = None,
         **kwargs: Any,
     ) -> SchemaComponent:
         if self.dtype_kwargs:
             pandas_dtype = pandas_dtype(**self.dtype_kwargs)  # type: ignore
-        checks = self.checks + _to_checklist(checks)
+        if checks:
+            checks = [*self.checks, *_to_checklist(checks)]
+        else:
+            # common case: no extra checks, skip the intermediate list
+            checks = list(self.checks)
         return component(pandas_dtype, checks=checks, **kwargs)  # type: ignore
 
     def to_column(
         self,
         pandas_dtype: PandasDtypeInputTypes,
-        checks: _CheckList = None,
+        checks: Optional[_CheckList] = None,
         required: bool = True,
         name: str = None,
     ) -> Column:
@@ -129,7 +143,7 @@ class FieldInfo:
     def to_index(
         self,
         pandas_dtype: PandasDtypeInputTypes,
-        checks: _CheckList = None,
+        checks: Optional[_CheckList] = None,
         name: str = None,
     ) -> Index:
         """Create a schema_components.Index from a field."""
@@ -198,26 +212,46 @@ def Field(
     :param kwargs: Specify custom checks that have been registered with the
         :class:`~pandera.extensions.register_check_method` decorator.
     """
-    # pylint:disable=C0103,W0613,R0914
+    # pylint:disable=C0103,R0914
     check_kwargs = {
         "ignore_na": ignore_na,
         "raise_warning": raise_warning,
         "n_failure_cases": n_failure_cases,
     }
-    args = locals()
-    checks = []
-
-    check_dispatch = _check_dispatch()
+    custom_checks = Check.REGISTERED_CUSTOM_CHECKS
     for key in kwargs:
-        if key not in check_dispatch:
+        if key not in custom_checks:
             raise SchemaInitError(
                 f"custom check '{key}' is not available. Make sure you use "
                 "pandera.extensions.register_check_method decorator to "
                 "register your custom check method."
             )
 
-    for arg_name, check_constructor in check_dispatch.items():
-        arg_value = args.get(arg_name, kwargs.get(arg_name))
+    check_dispatch = (
+        (eq, Check.equal_to),
+        (ne, Check.not_equal_to),
+        (gt, Check.greater_than),
+        (ge, Check.greater_than_or_equal_to),
+        (lt, Check.less_than),
+        (le, Check.less_than_or_equal_to),
+        (in_range, Check.in_range),
+        (isin, Check.isin),
+        (notin, Check.notin),
+        (str_contains, Check.str_contains),
+        (str_endswith, Check.str_endswith),
+        (str_matches, Check.str_matches),
+        (str_length, Check.str_length),
+        (str_startswith, Check.str_startswith),
+    )
+    if kwargs:
+        check_dispatch += tuple(
+            (kwargs[name], check_constructor)
+            for name, check_constructor in custom_checks.items()
+            if name in kwargs
+        )
+
+    checks = []
+    for arg_value, check_constructor in check_dispatch:
         if arg_value is None:
             continue
         if isinstance(arg_value, dict):
@@ -238,29 +272,11 @@ def Field(
     )
 
 
-def _check_dispatch():
-    return {
-        "eq": Check.equal_to,
-        "ne": Check.not_equal_to,
-        "gt": Check.greater_than,
-        "ge": Check.greater_than_or_equal_to,
-        "lt": Check.less_than,
-        "le": Check.less_than_or_equal_to,
-        "in_range": Check.in_range,
-        "isin": Check.isin,
-        "notin": Check.notin,
-        "str_contains": Check.str_contains,
-        "str_endswith": Check.str_endswith,
-        "str_matches": Check.str_matches,
-        "str_length": Check.str_length,
-        "str_startswith": Check.str_startswith,
-        **Check.REGISTERED_CUSTOM_CHECKS,
-    }
-
-
 class CheckInfo:  # pylint:disable=too-few-public-methods
     """Captures extra information about a Check."""
 
+    __slots__ = ("check_fn", "check_kwargs")
+
     def __init__(
         self,
         check_fn: AnyCallable,
@@ -286,9 +302,11 @@ class CheckInfo:  # pylint:disable=too-few-public-methods
 class FieldCheckInfo(CheckInfo):  # pylint:disable=too-few-public-methods
     """Captures extra information about a Check assigned to a field."""
 
+    __slots__ = ("fields", "regex", "_field_names", "_patterns")
+
     def __init__(
         self,
-        fields: Set[Union[str, FieldInfo]],
+        fields: AbstractSet[Union[str, FieldInfo]],
         check_fn: AnyCallable,
         regex: bool = False,
         **check_kwargs: Any,
@@ -296,6 +314,47 @@ class FieldCheckInfo(CheckInfo):  # pylint:disable=too-few-public-methods
         super().__init__(check_fn, **check_kwargs)
         self.fields = fields
         self.regex = regex
+        self._field_names: Optional[FrozenSet[str]] = None
+        self._patterns: Optional[List[Pattern]] = None
+
+    @property
+    def field_names(self) -> FrozenSet[str]:
+        """Names of the fields the check is assigned to.
+
+        Resolved on first access since :class:`FieldInfo` names are only
+        known once the model class is created.
+        """
+        if self._field_names is None:
+            self._field_names = frozenset(
+                field.name if isinstance(field, FieldInfo) else field
+                for field in self.fields
+            )
+        return self._field_names
+
+    @property
+    def patterns(self) -> List[Pattern]:
+        """Compiled field name patterns, used if ``regex`` is ``True``.
+
+        Several patterns are combined into a single alternation so that each
+        field name is only scanned once, unless a pattern uses groups or
+        global flags whose meaning would change once combined.
+        """
+        if self._patterns is None:
+            patterns = [re.compile(name) for name in self.field_names]
+            if len(patterns) > 1 and all(
+                not pattern.groups
+                and not _GLOBAL_FLAGS_RE.search(pattern.pattern)
+                for pattern in patterns
+            ):
+                patterns = [
+                    re.compile(
+                        "|".join(
+                            f"(?:{pattern.pattern})" for pattern in patterns
+                        )
+                    )
+                ]
+            self._patterns = patterns
+        return self._patterns
 
 
 def _to_function_and_classmethod(
@@ -330,7 +389,7 @@ def check(*fields, regex: bool = False, **check_kwargs) -> ClassCheck:
         setattr(
             check_method,
             CHECK_KEY,
-            FieldCheckInfo(set(fields), check_fn, regex, **check_kwargs),
+            FieldCheckInfo(frozenset(fields), check_fn, regex, **check_kwargs),
         )
         return check_method
 
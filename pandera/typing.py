@@ -1,7 +1,16 @@
 """Typing definitions and helpers."""
 # pylint:disable=abstract-method,disable=too-many-ancestors
 import sys
-from typing import TYPE_CHECKING, Generic, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generic,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import pandas as pd
 import typing_inspect
@@ -95,6 +104,12 @@ else:
         """
 
 
+_ParsedAnnotation = Tuple[Any, Any, bool, Optional[Tuple[Any, ...]], bool]
+
+_ANNOTATION_CACHE_SIZE = 1024
+_ANNOTATION_CACHE: Dict[int, Tuple[Type, _ParsedAnnotation]] = {}
+
+
 class AnnotationInfo:  # pylint:disable=too-few-public-methods
     """Captures extra information about an annotation.
 
@@ -122,31 +137,56 @@ class AnnotationInfo:  # pylint:disable=too-few-public-methods
         :returns: Annotation
         """
         self.raw_annotation = raw_annotation
-        self.origin = self.arg = None
-
-        self.optional = typing_inspect.is_optional_type(raw_annotation)
-        if self.optional and typing_inspect.is_union_type(raw_annotation):
-            # Annotated with Optional or Union[..., NoneType]
-            if LEGACY_TYPING:  # pragma: no cover
-                # get_args -> ((pandera.typing.Index, <class 'str'>), <class 'NoneType'>)
-                self.origin, self.arg = typing_inspect.get_args(
-                    raw_annotation
-                )[0]
-            # get_args -> (pandera.typing.Index[str], <class 'NoneType'>)
-            raw_annotation = typing_inspect.get_args(raw_annotation)[0]
-
-        if not (self.optional and LEGACY_TYPING):
-            self.origin = typing_inspect.get_origin(raw_annotation)
-            args = typing_inspect.get_args(raw_annotation)
-            self.arg = args[0] if args else args
-
-        self.metadata = getattr(self.arg, "__metadata__", None)
-        if self.metadata:
-            self.arg = typing_inspect.get_args(self.arg)[0]
-
-        self.literal = typing_inspect.is_literal_type(self.arg)
-        if self.literal:
-            self.arg = typing_inspect.get_args(self.arg)[0]
+        # key on identity: equal typing objects may differ in argument order
+        # or metadata, e.g. Union[None, X] == Optional[X] and
+        # Annotated[X, 1] == Annotated[X, True]
+        cached = _ANNOTATION_CACHE.get(id(raw_annotation))
+        if cached is not None and cached[0] is raw_annotation:
+            parsed = cached[1]
+        else:
+            parsed = _parse_annotation(raw_annotation)
+            if len(_ANNOTATION_CACHE) >= _ANNOTATION_CACHE_SIZE:
+                _ANNOTATION_CACHE.clear()
+            # hold a reference to the annotation so its id can't be reused
+            _ANNOTATION_CACHE[id(raw_annotation)] = (raw_annotation, parsed)
+        (
+            self.origin,
+            self.arg,
+            self.optional,
+            self.metadata,
+            self.literal,
+        ) = parsed
+
+
+def _parse_annotation(raw_annotation: Type) -> _ParsedAnnotation:
+    """Parse the origin, arg, optional, metadata and literal attributes of
+    :class:`AnnotationInfo`.
+    """
+    origin = arg = None
+
+    optional = typing_inspect.is_optional_type(raw_annotation)
+    if optional and typing_inspect.is_union_type(raw_annotation):
+        # Annotated with Optional or Union[..., NoneType]
+        if LEGACY_TYPING:  # pragma: no cover
+            # get_args -> ((pandera.typing.Index, <class 'str'>), <class 'NoneType'>)
+            origin, arg = typing_inspect.get_args(raw_annotation)[0]
+        # get_args -> (pandera.typing.Index[str], <class 'NoneType'>)
+        raw_annotation = typing_inspect.get_args(raw_annotation)[0]
+
+    if not (optional and LEGACY_TYPING):
+        origin = typing_inspect.get_origin(raw_annotation)
+        args = typing_inspect.get_args(raw_annotation)
+        arg = args[0] if args else args
+
+    metadata = getattr(arg, "__metadata__", None)
+    if metadata:
+        arg = typing_inspect.get_args(arg)[0]
+
+    literal = typing_inspect.is_literal_type(arg)
+    if literal:
+        arg = typing_inspect.get_args(arg)[0]
+
+    return origin, arg, optional, metadata, literal
 
 
 Bool = Literal[PandasDtype.Bool]  #: ``"bool"`` numpy dtype
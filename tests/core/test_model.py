@@ -1,6 +1,7 @@
 """Tests schema creation and validation from type annotations."""
 # pylint:disable=missing-class-docstring,missing-function-docstring,too-few-public-methods
 import re
+import warnings
 from decimal import Decimal  # pylint:disable=C0415
 from typing import Iterable, Optional
 
@@ -86,6 +87,17 @@ def test_invalid_annotations():
         InvalidDtype.to_schema()
 
 
+def test_private_annotations_ignored():
+    """Test that private annotations are not converted to fields."""
+
+    class Schema(pa.SchemaModel):
+        a: Series[int]
+        _b: int
+        _c: int = 0
+
+    assert Schema.to_schema() == pa.DataFrameSchema({"a": pa.Column(int)})
+
+
 def test_optional_column():
     """Test that optional columns are not required."""
 
@@ -429,6 +441,66 @@ def test_check_regex():
         Schema.validate(df, lazy=True)
 
 
+def test_check_multiple_regex():
+    """Test the check decorator with several regexes, reused by a subclass."""
+
+    class Base(pa.SchemaModel):
+        a: Series[int]
+        abc: Series[int]
+        cba: Series[int]
+
+        @pa.check("^a", "^c", regex=True)
+        @classmethod
+        def int_column_lt_100(cls, series: pd.Series) -> Iterable[bool]:
+            return series < 100
+
+    class Child(Base):
+        bcd: Series[int]
+
+    df = pd.DataFrame({"a": [101], "abc": [1], "cba": [200], "bcd": [300]})
+    for model in [Base, Child]:
+        schema = model.to_schema()
+        assert len(schema.columns["a"].checks) == 1
+        assert len(schema.columns["cba"].checks) == 1
+        with pytest.raises(
+            pa.errors.SchemaErrors, match="2 schema errors were found"
+        ):
+            model.validate(df, lazy=True)
+    assert not Child.to_schema().columns["bcd"].checks
+
+
+@pytest.mark.parametrize(
+    "regexes,expected",
+    [
+        (("^a", "^c"), {"a", "abc", "cba"}),
+        (("^(a)b", "^c"), {"abc", "cba"}),
+        (("(?i)^A", "^c"), {"a", "abc", "cba"}),
+        (("^(?i:A)$", "^c"), {"a", "cba"}),
+        (("(?u)^a", "^c"), {"a", "abc", "cba"}),
+    ],
+)
+def test_check_regex_patterns(regexes, expected):
+    """Test that several regexes match like each regex applied separately."""
+
+    class Schema(pa.SchemaModel):
+        a: Series[int]
+        abc: Series[int]
+        cba: Series[int]
+        bcd: Series[int]
+
+        @pa.check(*regexes, regex=True)
+        @classmethod
+        def int_column_lt_100(cls, series: pd.Series) -> Iterable[bool]:
+            return series < 100
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        schema = Schema.to_schema()
+    assert {
+        name for name, column in schema.columns.items() if column.checks
+    } == expected
+
+
 def test_inherit_schemamodel_fields():
     """Test that columns and indices are inherited."""
 
@@ -451,6 +523,79 @@ def test_inherit_schemamodel_fields():
     assert expected == Child.to_schema()
 
 
+def test_inherit_schemamodel_fields_multiple_bases():
+    """Test that fields are inherited from multiple bases in mro order."""
+
+    class A(pa.SchemaModel):
+        a: Series[int]
+        c: Series[int]
+
+    class B(pa.SchemaModel):
+        b: Series[int]
+        c: Series[str]
+
+    class Child(A, B):
+        d: Series[int]
+
+    expected = pa.DataFrameSchema(
+        columns={
+            "a": pa.Column(int),
+            "b": pa.Column(int),
+            "c": pa.Column(int),
+            "d": pa.Column(int),
+        },
+    )
+    assert expected == Child.to_schema()
+
+
+def test_inherit_fields_attached_after_parent_schema():
+    """Test that subclasses see attributes set on a built parent model."""
+
+    class Parent(pa.SchemaModel):
+        a: Series[int]
+
+    Parent.to_schema()
+    Parent.a = pa.Field(gt=0, alias="A")  # type: ignore
+
+    class Child(Parent):
+        b: Series[int]
+
+    schema = Child.to_schema()
+    assert set(schema.columns) == {"A", "b"}
+    assert schema.columns["A"].checks == [pa.Check.gt(0)]
+
+    Parent.zz = 5  # type: ignore
+
+    class OtherChild(Parent):
+        b: Series[int]
+
+    err_msg = re.escape("Found missing annotations: ['zz']")
+    with pytest.raises(pa.errors.SchemaInitError, match=err_msg):
+        OtherChild.to_schema()
+
+
+def test_to_schema_cached_per_model():
+    """Test that each model caches its own schema."""
+
+    class Base(pa.SchemaModel):
+        a: Series[int]
+
+    class Child(Base):
+        b: Series[str]
+
+    base_schema = Base.to_schema()
+    assert Child.__schema__ is None
+    child_schema = Child.to_schema()
+    assert Child.__schema__ is child_schema
+
+    assert base_schema is Base.to_schema()
+    assert child_schema is Child.to_schema()
+    assert base_schema == pa.DataFrameSchema({"a": pa.Column(int)})
+    assert child_schema == pa.DataFrameSchema(
+        {"a": pa.Column(int), "b": pa.Column(str)}
+    )
+
+
 def test_inherit_schemamodel_fields_alias():
     """Test that columns and index aliases are inherited."""
 
@@ -530,6 +675,35 @@ def test_inherit_field_checks():
         schema.validate(df, lazy=True)
 
 
+def test_checks_attached_after_class_creation():
+    """Test that checks added to a model after its creation are applied."""
+
+    class Base(pa.SchemaModel):
+        a: Series[int]
+
+    class Child(Base):
+        b: Series[int]
+
+    def a_max(cls, series: pd.Series) -> Iterable[bool]:
+        # pylint:disable=unused-argument
+        return series < 100
+
+    def not_empty(cls, df: pd.DataFrame) -> bool:
+        # pylint:disable=unused-argument
+        return not df.empty
+
+    Base.a_max = pa.check("a")(a_max)  # type: ignore
+    Child.not_empty = pa.dataframe_check(not_empty)  # type: ignore
+
+    base_schema = Base.to_schema()
+    assert len(base_schema.columns["a"].checks) == 1
+    assert not base_schema.checks
+
+    child_schema = Child.to_schema()
+    assert len(child_schema.columns["a"].checks) == 1
+    assert len(child_schema.checks) == 1
+
+
 def test_dataframe_check():
     """Test dataframe checks."""
 
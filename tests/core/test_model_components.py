@@ -35,6 +35,27 @@ def test_field_no_checks():
     assert not pa.Field().to_column(str).checks
 
 
+def test_field_checks_not_shared():
+    """Test that schema components don't share the Field's checks."""
+    field = pa.Field(gt=0)
+    col = field.to_column(int)
+    col.checks.append(pa.Check.lt(10))
+    assert len(field.checks) == 1
+    assert len(field.to_column(int).checks) == 1
+
+    index = field.to_index(int, checks=pa.Check.lt(10))
+    assert len(index.checks) == 2
+    assert len(field.checks) == 1
+
+
+def test_field_info_checks():
+    """Test that FieldInfo accepts a single check or a list of checks."""
+    check = pa.Check.gt(0)
+    assert pa.model_components.FieldInfo().checks == ()
+    assert pa.model_components.FieldInfo(checks=check).checks == (check,)
+    assert pa.model_components.FieldInfo(checks=[check]).checks == (check,)
+
+
 @pytest.mark.parametrize(
     "arg,value,expected",
     [
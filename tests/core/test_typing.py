@@ -1,7 +1,7 @@
 """Test typing annotations for the model api."""
 # pylint:disable=missing-class-docstring,too-few-public-methods
 import re
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 import numpy as np
 import pandas as pd
@@ -9,7 +9,12 @@ import pytest
 
 import pandera as pa
 from pandera.dtypes import LEGACY_PANDAS, PandasDtype
-from pandera.typing import LEGACY_TYPING, Series
+from pandera.typing import (
+    LEGACY_TYPING,
+    AnnotationInfo,
+    Series,
+    _parse_annotation,
+)
 
 if not LEGACY_TYPING:
     try:  # python 3.9+
@@ -126,6 +131,33 @@ class SchemaUINT64(pa.SchemaModel):
     col: Series[pa.typing.UINT64]
 
 
+@pytest.mark.parametrize(
+    "annotations",
+    [
+        (Union[None, Series[int]], Optional[Series[int]]),
+        (Optional[Series[int]], Union[None, Series[int]]),
+    ],
+)
+def test_annotation_info_equal_annotations(annotations: Tuple[Type, Type]):
+    """Test that equal annotations are parsed independently of each other."""
+    assert annotations[0] == annotations[1]
+    for annotation in annotations:
+        info = AnnotationInfo(annotation)
+        parsed = (
+            info.origin,
+            info.arg,
+            info.optional,
+            info.metadata,
+            info.literal,
+        )
+        assert parsed == _parse_annotation(annotation)
+
+    info = AnnotationInfo(Optional[Series[int]])
+    assert info.origin is Series
+    assert info.arg is int
+    assert info.optional
+
+
 def _test_literal_pandas_dtype(
     model: Type[pa.SchemaModel], pandas_dtype: PandasDtype
 ):